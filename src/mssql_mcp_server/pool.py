@@ -0,0 +1,201 @@
+"""Connection pool for reusing ODBC connections across MCP requests."""
+import asyncio
+import collections
+import contextlib
+import functools
+import logging
+import time
+from typing import Any
+
+import pyodbc
+
+logger = logging.getLogger("mssql_mcp_server")
+
+# Upper bound for the pool size; beyond this SQL Server mostly queues work anyway
+MAX_POOL_SIZE = 50
+
+# Supported driver backends; turbodbc is an optional dependency
+BACKENDS = ("pyodbc", "turbodbc")
+
+
+def _import_turbodbc():
+    try:
+        import turbodbc
+    except ImportError as e:
+        raise RuntimeError(
+            "The turbodbc backend requires the turbodbc extra: pip install 'mssql_mcp_server[turbodbc]'"
+        ) from e
+    return turbodbc
+
+
+class ConnectionPool:
+    """Bounded pool of pyodbc (or turbodbc) connections shared by the MCP handlers.
+
+    Connections are opened lazily, at most ``max_size`` at a time. A connection
+    that has been idle for longer than ``validate_after`` seconds is checked with
+    ``SELECT 1`` before it is handed out and replaced if the check fails.
+    Blocking ODBC calls run in worker threads so the event loop stays responsive.
+    ``reset_sql`` runs on every returned connection before it is reused, to undo
+    session state (current database, ``SET`` options) left behind by arbitrary SQL.
+    """
+
+    def __init__(self, conn_string: str, min_size: int = 1, max_size: int = 10,
+                 validate_after: float = 30.0, backend: str = "pyodbc",
+                 reset_sql: str | None = None):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"Invalid pool size: min={min_size}, max={max_size}")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown driver backend: {backend}")
+        self.conn_string = conn_string
+        self.backend = backend
+        self._turbodbc = _import_turbodbc() if backend == "turbodbc" else None
+        self._errors = (pyodbc.Error, self._turbodbc.Error) if self._turbodbc else pyodbc.Error
+        self.max_size = min(max_size, MAX_POOL_SIZE)
+        self.min_size = min(min_size, self.max_size)
+        self.validate_after = validate_after
+        self.reset_sql = reset_sql
+        # Set by close(); connections checked in afterwards are closed, not kept
+        self.closed = False
+        # Idle (connection, last_used) pairs; LIFO keeps recently used connections warm
+        self._idle: collections.deque[tuple[Any, float]] = collections.deque()
+        self._slots = asyncio.Semaphore(self.max_size)
+        # Tasks closing abandoned connections; the loop only keeps weak references
+        self._closing: set[asyncio.Future] = set()
+
+    def _connect(self):
+        if self._turbodbc is not None:
+            # Recommended by turbodbc for Microsoft's SQL Server ODBC driver
+            options = self._turbodbc.make_options(prefer_unicode=True)
+            return self._turbodbc.connect(connection_string=self.conn_string, turbodbc_options=options)
+        return pyodbc.connect(self.conn_string)
+
+    def _discard(self, conn) -> None:
+        try:
+            conn.close()
+        except self._errors as e:
+            logger.warning(f"Error closing pooled connection: {str(e)}")
+
+    def _is_alive(self, conn) -> bool:
+        try:
+            with contextlib.closing(conn.cursor()) as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+            return True
+        except self._errors:
+            return False
+
+    def _reset(self, conn) -> bool:
+        """Run ``reset_sql`` and roll back any open transaction, closing the connection if that fails."""
+        try:
+            if self.reset_sql:
+                with contextlib.closing(conn.cursor()) as cursor:
+                    cursor.execute(self.reset_sql)
+            conn.rollback()
+            return True
+        except self._errors:
+            self._discard(conn)
+            return False
+
+    async def _checkout(self):
+        """Return a usable connection, reusing an idle one when possible."""
+        while self._idle:
+            conn, last_used = self._idle.pop()
+            if time.monotonic() - last_used < self.validate_after:
+                return conn
+            if await asyncio.to_thread(self._is_alive, conn):
+                return conn
+            logger.info("Discarding stale pooled connection")
+            await asyncio.to_thread(self._discard, conn)
+        return await asyncio.to_thread(self._connect)
+
+    async def _checkin(self, conn, discard: bool = False) -> None:
+        """Return the connection to the pool if it can be reset."""
+        if discard or self.closed:
+            await asyncio.to_thread(self._discard, conn)
+        elif await asyncio.to_thread(self._reset, conn):
+            # The pool may have been closed while the reset ran
+            if self.closed:
+                await asyncio.to_thread(self._discard, conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+
+    async def fill(self) -> None:
+        """Open connections until ``min_size`` idle connections are available."""
+        while len(self._idle) < self.min_size and not self.closed:
+            conn = await asyncio.to_thread(self._connect)
+            if self.closed:
+                await asyncio.to_thread(self._discard, conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+
+    async def _release(self, conn, discard: bool) -> None:
+        try:
+            await self._checkin(conn, discard)
+        finally:
+            self._slots.release()
+
+    def _abandon(self, conn, task) -> None:
+        """Close a connection whose caller was cancelled, once its worker thread is done."""
+        if not task.cancelled():
+            task.exception()  # Mark the result as retrieved
+        closing = asyncio.ensure_future(asyncio.to_thread(self._discard, conn))
+        self._closing.add(closing)
+        closing.add_done_callback(self._closed)
+
+    def _closed(self, closing) -> None:
+        self._closing.discard(closing)
+        self._slots.release()
+
+    def _abandon_checkout(self, checkout) -> None:
+        """Close the connection a cancelled caller was checking out, or free its slot if there is none."""
+        if checkout.cancelled() or checkout.exception() is not None:
+            self._slots.release()
+        else:
+            self._abandon(checkout.result(), checkout)
+
+    async def run(self, func, *args, discard: bool = False):
+        """Run ``func(conn, *args)`` in a worker thread on a pooled connection.
+
+        Afterwards the connection is closed if ``discard`` is set, otherwise it is
+        reset and returned to the pool. Errors such as a bad query leave the
+        connection usable, so it is returned the same way (or dropped if the reset
+        fails). If the caller is cancelled, the thread keeps running (including
+        one still opening or validating the connection); its connection stays
+        checked out and holds its slot until the thread finishes, and is then
+        closed.
+        """
+        await self._slots.acquire()
+        checkout = asyncio.ensure_future(self._checkout())
+        try:
+            conn = await asyncio.shield(checkout)
+        except asyncio.CancelledError:
+            checkout.add_done_callback(self._abandon_checkout)
+            raise
+        except Exception:
+            self._slots.release()
+            raise
+        task = asyncio.ensure_future(asyncio.to_thread(func, conn, *args))
+        try:
+            result = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            task.add_done_callback(functools.partial(self._abandon, conn))
+            raise
+        except Exception:
+            await asyncio.shield(self._release(conn, discard))
+            raise
+        await asyncio.shield(self._release(conn, discard))
+        return result
+
+    async def aclose(self) -> None:
+        """Like ``close()``, but close idle connections in worker threads."""
+        self.closed = True
+        while self._idle:
+            conn, _ = self._idle.pop()
+            await asyncio.to_thread(self._discard, conn)
+
+    def close(self) -> None:
+        """Close all idle connections; checked-out ones are closed when returned."""
+        self.closed = True
+        while self._idle:
+            conn, _ = self._idle.pop()
+            self._discard(conn)
@@ -1,12 +1,21 @@
 import asyncio
+import concurrent.futures
+import contextlib
+import csv
+import functools
+import io
 import logging
 import os
 import re
+import string
+import time
 import pyodbc
 from mcp.server import Server
 from mcp.types import Resource, Tool, TextContent
 from pydantic import AnyUrl
 
+from .pool import ConnectionPool
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -14,14 +23,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger("mssql_mcp_server")
 
+# Characters allowed in each part of a (schema.)table name
+_TABLE_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+# SQL comments, both /* ... */ and -- to end of line
+_SQL_COMMENT_RE = re.compile(r'/\*.*?\*/|--[^\n]*', re.DOTALL)
+# String literals, quoted identifiers and comments
+_SQL_QUOTED_RE = re.compile(r"'[^']*'|\[[^\]]*\]|\"[^\"]*\"|/\*.*?\*/|--[^\n]*", re.DOTALL)
+# Keywords that may leave session state the pool's reset does not undo: SET options,
+# procedure calls, open keys and cursors, and temporary objects. T-SQL statements
+# need no separator, so these are matched anywhere in the query
+_SESSION_STATEMENT_RE = re.compile(
+    r'\b(?:SET|EXEC|EXECUTE|OPEN)\b|\bDECLARE\b.*?\bCURSOR\b|#', re.IGNORECASE | re.DOTALL
+)
+# SELECT ... INTO creates a table
+_INTO_RE = re.compile(r'\bINTO\b', re.IGNORECASE)
+# Queries listing tables get a MySQL-style "Tables_in_<db>" result
+_INFORMATION_SCHEMA_TABLES_RE = re.compile(r'\bINFORMATION_SCHEMA\.TABLES\b', re.IGNORECASE)
+
 def validate_table_name(table_name: str) -> str:
     """Validate and escape table name to prevent SQL injection."""
     # Allow only alphanumeric, underscore, and dot (for schema.table)
-    if not re.match(r'^[a-zA-Z0-9_]+(\.[a-zA-Z0-9_]+)?$', table_name):
+    parts = table_name.split('.')
+    if len(parts) > 2 or not all(part and _TABLE_NAME_CHARS.issuperset(part) for part in parts):
         raise ValueError(f"Invalid table name: {table_name}")
     
-    # Split schema and table if present
-    parts = table_name.split('.')
+    # Escape schema and table if present
     if len(parts) == 2:
         # Escape both schema and table name
         return f"[{parts[0]}].[{parts[1]}]"
@@ -29,78 +55,85 @@ def validate_table_name(table_name: str) -> str:
         # Just table name
         return f"[{table_name}]"
 
-def get_db_config():
-    """Get database configuration from environment variables and return connection string."""
-    # Basic configuration
-    server = os.getenv("MSSQL_SERVER", "localhost")
-    logger.info(f"MSSQL_SERVER environment variable: {os.getenv('MSSQL_SERVER', 'NOT SET')}")
-    logger.info(f"Using server: {server}")
-    
-    database = os.getenv("MSSQL_DATABASE")
-    user = os.getenv("MSSQL_USER")
-    password = os.getenv("MSSQL_PASSWORD")
-    port = os.getenv("MSSQL_PORT", "1433")
-    
-    # Handle LocalDB connections (Issue #6)
-    # LocalDB format: (localdb)\instancename
-    if server.startswith("(localdb)\\"):
-        instance_name = server.replace("(localdb)\\", "")
-        server = f"(localdb)\\{instance_name}"
-        logger.info(f"Detected LocalDB connection: {server}")
-    
-    # Windows Authentication support (Issue #7)
-    use_windows_auth = os.getenv("MSSQL_WINDOWS_AUTH", "false").lower() == "true"
-    
-    # Get available ODBC drivers
+@functools.cache
+def _sqlserver_driver() -> str:
+    """Return the first installed SQL Server ODBC driver, looked up once per process."""
     drivers = [d for d in pyodbc.drivers() if 'SQL Server' in d]
     if not drivers:
         raise RuntimeError("No SQL Server ODBC driver found. Please install ODBC Driver for SQL Server.")
     
     driver = drivers[0]  # Use the first available driver
-    logger.info(f"Using ODBC driver: {driver}")
+    logger.info("Using ODBC driver: %s", driver)
+    return driver
+
+@functools.lru_cache(maxsize=32)
+def _build_conn_string(driver: str, server: str, port: str, database: str,
+                       credentials: tuple[str, str] | None, encrypt: bool) -> str:
+    """Build an ODBC connection string, formatting each distinct set of inputs only once.
+
+    ``credentials`` is ``(user, password)`` for SQL Authentication or ``None`` for
+    Windows Authentication.
+    """
+    if credentials is None:
+        auth = "Trusted_Connection=yes"
+    else:
+        auth = f"UID={credentials[0]};PWD={credentials[1]}"
     
-    # Build connection string
-    conn_parts = [f"DRIVER={{{driver}}}"]
+    # Azure SQL validates the server certificate; other servers commonly use self-signed ones
+    if not encrypt:
+        encryption = ""
+    elif ".database.windows.net" in server:
+        encryption = ";Encrypt=yes;TrustServerCertificate=no"
+    else:
+        encryption = ";Encrypt=yes;TrustServerCertificate=yes"
     
-    # Add server and port
+    # LocalDB instances do not take a port
     if port and port != "1433" and not server.startswith("(localdb)"):
-        conn_parts.append(f"SERVER={server},{port}")
-    else:
-        conn_parts.append(f"SERVER={server}")
+        server = f"{server},{port}"
+    return f"DRIVER={{{driver}}};SERVER={server};DATABASE={database};{auth}{encryption}"
+
+@functools.lru_cache(maxsize=1)
+def get_db_config():
+    """Get database configuration from environment variables and return connection string.
+
+    The result is cached for the lifetime of the process; call
+    ``get_db_config.cache_clear()`` (or set ``MSSQL_CONFIG_RELOAD=true``) to
+    pick up changed environment variables.
+    """
+    # Read all settings up front
+    env = os.environ
+    server = env.get("MSSQL_SERVER", "localhost")
+    database = env.get("MSSQL_DATABASE")
+    user = env.get("MSSQL_USER")
+    password = env.get("MSSQL_PASSWORD")
+    port = env.get("MSSQL_PORT", "1433")
+    # Windows Authentication support (Issue #7)
+    use_windows_auth = env.get("MSSQL_WINDOWS_AUTH", "false").lower() == "true"
+    # Azure SQL requires encryption, so it defaults to on there (Issue #11)
+    is_azure = ".database.windows.net" in server
+    encrypt = env.get("MSSQL_ENCRYPT", "true" if is_azure else "false").lower() == "true"
+    # LocalDB format: (localdb)\instancename (Issue #6)
+    is_localdb = server.startswith("(localdb)")
+    logger.debug("Using server: %s%s", server, " (LocalDB)" if is_localdb else "")
+    
+    driver = _sqlserver_driver()
     
     if not database:
         logger.error("MSSQL_DATABASE is required")
         raise ValueError("Missing required database configuration")
-    conn_parts.append(f"DATABASE={database}")
     
     if use_windows_auth:
-        # For Windows authentication
-        conn_parts.append("Trusted_Connection=yes")
-        logger.info("Using Windows Authentication")
-    else:
+        logger.debug("Using Windows Authentication")
+        credentials = None
+    elif not user or not password:
         # SQL Authentication - user and password are required
-        if not user or not password:
-            logger.error("Missing required database configuration. Please check environment variables:")
-            logger.error("MSSQL_USER and MSSQL_PASSWORD are required for SQL Authentication")
-            raise ValueError("Missing required database configuration")
-        conn_parts.append(f"UID={user}")
-        conn_parts.append(f"PWD={password}")
-    
-    # Encryption settings for Azure SQL (Issue #11)
-    if ".database.windows.net" in server:
-        # Azure SQL requires encryption
-        encrypt = os.getenv("MSSQL_ENCRYPT", "true").lower() == "true"
-        if encrypt:
-            conn_parts.append("Encrypt=yes")
-            conn_parts.append("TrustServerCertificate=no")
+        logger.error("Missing required database configuration. Please check environment variables:")
+        logger.error("MSSQL_USER and MSSQL_PASSWORD are required for SQL Authentication")
+        raise ValueError("Missing required database configuration")
     else:
-        # For non-Azure connections, respect the MSSQL_ENCRYPT setting
-        encrypt_str = os.getenv("MSSQL_ENCRYPT", "false")
-        if encrypt_str.lower() == "true":
-            conn_parts.append("Encrypt=yes")
-            conn_parts.append("TrustServerCertificate=yes")
+        credentials = (user, password)
     
-    conn_string = ";".join(conn_parts)
+    conn_string = _build_conn_string(driver, server, port, database, credentials, encrypt)
     
     # Return both connection string and metadata for logging
     return {
@@ -111,33 +144,193 @@ def get_db_config():
         "port": port
     }
 
-def get_command():
-    """Get the command to execute SQL queries."""
-    return os.getenv("MSSQL_COMMAND", "execute_sql")
+# Re-read the environment on every request instead of caching the config
+CONFIG_RELOAD = os.getenv("MSSQL_CONFIG_RELOAD", "false").lower() == "true"
+
+def _load_config():
+    """Return the cached database configuration, re-reading it if reload is enabled."""
+    if CONFIG_RELOAD:
+        get_db_config.cache_clear()
+    return get_db_config()
+
+# Connection pool sizing
+POOL_MIN = int(os.getenv("MSSQL_POOL_MIN", "1"))
+POOL_MAX = int(os.getenv("MSSQL_POOL_MAX", "10"))
+# "pyodbc" (default) or "turbodbc" for columnar fetches of large SELECT results
+DRIVER_BACKEND = os.getenv("MSSQL_DRIVER_BACKEND", "pyodbc").lower()
+
+_pool = None
+
+async def get_pool(config) -> ConnectionPool:
+    """Return the shared connection pool, recreating it if the connection string changed."""
+    global _pool
+    if _pool is None or _pool.conn_string != config["conn_string"]:
+        database = config["database"].replace("]", "]]")
+        retired, _pool = _pool, ConnectionPool(
+            config["conn_string"], min_size=POOL_MIN, max_size=POOL_MAX, backend=DRIVER_BACKEND,
+            reset_sql=f"USE [{database}]; SET ROWCOUNT 0"
+        )
+        if retired is not None:
+            await retired.aclose()
+    return _pool
+
+def close_pool() -> None:
+    """Close idle connections held by the shared pool and discard it."""
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        _pool = None
+
+# Name of the tool that executes SQL queries
+COMMAND = os.getenv("MSSQL_COMMAND", "execute_sql")
+# Name of the tool that previews several tables at once
+READ_TABLES_COMMAND = "read_tables"
+if COMMAND == READ_TABLES_COMMAND:
+    raise ValueError(f"MSSQL_COMMAND cannot be '{READ_TABLES_COMMAND}', which is reserved for the table preview tool")
 
 def is_select_query(query: str) -> bool:
     """
     Check if a query is a SELECT statement, accounting for comments.
     Handles both single-line (--) and multi-line (/* */) SQL comments.
     """
-    # Remove multi-line comments /* ... */
-    query_cleaned = re.sub(r'/\*.*?\*/', '', query, flags=re.DOTALL)
+    query_cleaned = query.lstrip()
+    # Comments only matter when they come before the first keyword; they act as
+    # whitespace, so replace them with a space in one pass
+    if query_cleaned.startswith(("--", "/*")):
+        query_cleaned = _SQL_COMMENT_RE.sub(' ', query_cleaned).lstrip()
     
-    # Remove single-line comments -- ...
-    lines = query_cleaned.split('\n')
-    cleaned_lines = []
-    for line in lines:
-        # Find -- comment marker and remove everything after it
-        comment_pos = line.find('--')
-        if comment_pos != -1:
-            line = line[:comment_pos]
-        cleaned_lines.append(line)
-    
-    query_cleaned = '\n'.join(cleaned_lines)
+    # The query must start with the SELECT keyword, not e.g. SELECTED_ROWS
+    if query_cleaned[:6].upper() != "SELECT":
+        return False
+    return len(query_cleaned) == 6 or not (query_cleaned[6].isalnum() or query_cleaned[6] == '_')
+
+def strip_quoted(query: str) -> str:
+    """Blank out string literals, quoted identifiers and comments, which cannot contain statements."""
+    return _SQL_QUOTED_RE.sub(' ', query)
+
+def changes_session(unquoted: str, is_select: bool) -> bool:
+    """
+    Check if a query may leave session state behind that a connection reset does not undo.
+    ``unquoted`` is the query passed through ``strip_quoted()``. Only a plain SELECT
+    without session keywords is considered safe; everything else may be, e.g. a
+    procedure called without EXEC.
+    """
+    return not is_select or bool(_SESSION_STATEMENT_RE.search(unquoted))
+
+# Rows fetched per call when streaming result sets
+ARRAYSIZE = int(os.getenv("MSSQL_ARRAYSIZE", "1000"))
+
+def _write_csv(header: list[str], batches) -> str:
+    """Write a header and batches of rows as CSV text.
+
+    Values are converted and quoted by the C ``csv`` writer rather than per-cell
+    ``str()`` calls; NULLs become empty fields.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerow(header)
+    for batch in batches:
+        writer.writerows(batch)
+    # Drop the final line terminator
+    buf.truncate(buf.tell() - 1)
+    return buf.getvalue()
+
+def _format_rows(cursor, header: list[str] | None = None) -> str:
+    """Format the result of an executed query as CSV, fetching ``cursor.arraysize`` rows at a time.
+
+    If ``header`` is given it replaces the column names and rows are cut to the
+    same number of columns.
+    """
+    batches = iter(cursor.fetchmany, [])
+    if header is None:
+        return _write_csv([desc[0] for desc in cursor.description], batches)
+    width = len(header)
+    return _write_csv(header, ((row[:width] for row in batch) for batch in batches))
+
+def _format_columns(cursor) -> str:
+    """Format a turbodbc result as CSV from columnar NumPy arrays.
+
+    ``fetchnumpybatches()`` fills typed arrays straight from the ODBC buffers one
+    batch at a time, so only a batch of rows is held as Python objects while the
+    CSV text accumulates; masked (NULL) entries come back as None from ``tolist()``.
+    """
+    names = [desc[0] for desc in cursor.description]
+    # Batches are keyed by column name, so duplicate or unnamed columns would collapse
+    if "" in names or len(set(names)) != len(names):
+        return _format_rows(cursor)
+    return _write_csv(names, (
+        zip(*(column.tolist() for column in columns.values()))
+        for columns in cursor.fetchnumpybatches()
+    ))
+
+def _do_list_resources(conn) -> list[Resource]:
+    """Fetch user tables and build resources (blocking; runs in a worker thread)."""
+    with contextlib.closing(conn.cursor()) as cursor:
+        # Query to get user tables from the current database, qualified by schema
+        cursor.execute("""
+            SELECT CONCAT(TABLE_SCHEMA, '.', TABLE_NAME)
+            FROM INFORMATION_SCHEMA.TABLES 
+            WHERE TABLE_TYPE = 'BASE TABLE'
+        """)
+        tables = [row[0] for row in cursor.fetchall()]
+    logger.debug("Found tables: %s", tables)
     
-    # Get the first non-empty word after stripping whitespace
-    first_word = query_cleaned.strip().split()[0] if query_cleaned.strip() else ""
-    return first_word.upper() == "SELECT"
+    return [
+        Resource(
+            uri=f"mssql://{table}/data",
+            name=f"Table: {table}",
+            mimeType="text/plain",
+            description=f"Data in table: {table}"
+        )
+        for table in tables
+    ]
+
+def _do_read_resource(conn, safe_table: str) -> str:
+    """Read the first rows of an already validated table (blocking)."""
+    with contextlib.closing(conn.cursor()) as cursor:
+        cursor.arraysize = ARRAYSIZE
+        # Use TOP 100 for MSSQL (equivalent to LIMIT in MySQL)
+        cursor.execute(f"SELECT TOP 100 * FROM {safe_table}")
+        return _format_rows(cursor)
+
+def _do_call_tool(conn, query: str, is_select: bool, database: str) -> str:
+    """Execute a query and format its result as text (blocking)."""
+    with contextlib.closing(conn.cursor()) as cursor:
+        cursor.arraysize = ARRAYSIZE
+        if DRIVER_BACKEND == "pyodbc":
+            cursor.fast_executemany = True
+        cursor.execute(query)
+        # SELECT ... INTO returns no result set and is committed like other statements
+        is_select = is_select and cursor.description is not None
+        
+        # Special handling for table listing
+        if is_select and _INFORMATION_SCHEMA_TABLES_RE.search(query):
+            return _format_rows(cursor, header=["Tables_in_" + database])
+        
+        # Regular SELECT queries
+        elif is_select:
+            if DRIVER_BACKEND == "turbodbc":
+                return _format_columns(cursor)
+            return _format_rows(cursor)
+        
+        # Non-SELECT queries
+        else:
+            conn.commit()
+            return f"Query executed successfully. Rows affected: {cursor.rowcount}"
+
+# Seconds a table listing is reused before querying the database again
+RESOURCES_TTL = float(os.getenv("MSSQL_RESOURCES_TTL", "30"))
+
+# (conn_string, expires_at, resources) for the last successful list_resources call
+_resources_cache = None
+# Bumped on every invalidation, so a listing started before it is not cached
+_resources_generation = 0
+
+def clear_resources_cache() -> None:
+    """Forget the cached table listing."""
+    global _resources_cache, _resources_generation
+    _resources_cache = None
+    _resources_generation += 1
 
 # Initialize server
 app = Server("mssql_mcp_server")
@@ -145,42 +338,47 @@ app = Server("mssql_mcp_server")
 @app.list_resources()
 async def list_resources() -> list[Resource]:
     """List SQL Server tables as resources."""
-    config = get_db_config()
+    global _resources_cache
+    config = _load_config()
+    if _resources_cache is not None:
+        conn_string, expires_at, resources = _resources_cache
+        if conn_string == config["conn_string"] and time.monotonic() < expires_at:
+            return list(resources)
+    generation = _resources_generation
     try:
-        conn = pyodbc.connect(config["conn_string"])
-        cursor = conn.cursor()
-        # Query to get user tables from the current database
-        cursor.execute("""
-            SELECT TABLE_NAME 
-            FROM INFORMATION_SCHEMA.TABLES 
-            WHERE TABLE_TYPE = 'BASE TABLE'
-        """)
-        tables = cursor.fetchall()
-        logger.info(f"Found tables: {tables}")
-        
-        resources = []
-        for table in tables:
-            resources.append(
-                Resource(
-                    uri=f"mssql://{table[0]}/data",
-                    name=f"Table: {table[0]}",
-                    mimeType="text/plain",
-                    description=f"Data in table: {table[0]}"
-                )
-            )
-        cursor.close()
-        conn.close()
-        return resources
+        pool = await get_pool(config)
+        resources = await pool.run(_do_list_resources)
+        if generation == _resources_generation:
+            _resources_cache = (config["conn_string"], time.monotonic() + RESOURCES_TTL, resources)
+        return list(resources)
     except Exception as e:
+        clear_resources_cache()
         logger.error(f"Failed to list resources: {str(e)}")
         return []
 
+async def _read_table(config, table: str) -> str:
+    """Validate a table name and read its first rows using a pooled connection."""
+    # Validate table name to prevent SQL injection
+    safe_table = validate_table_name(table)
+    pool = await get_pool(config)
+    return await pool.run(_do_read_resource, safe_table)
+
+async def _read_many(config, tables: list[str]) -> list:
+    """Read several tables concurrently, each on its own pooled connection.
+
+    Failures are returned in place of the result for that table.
+    """
+    return await asyncio.gather(
+        *(_read_table(config, table) for table in tables),
+        return_exceptions=True
+    )
+
 @app.read_resource()
 async def read_resource(uri: AnyUrl) -> str:
     """Read table contents."""
-    config = get_db_config()
+    config = _load_config()
     uri_str = str(uri)
-    logger.info(f"Reading resource: {uri_str}")
+    logger.info("Reading resource: %s", uri_str)
     
     if not uri_str.startswith("mssql://"):
         raise ValueError(f"Invalid URI scheme: {uri_str}")
@@ -189,19 +387,7 @@ async def read_resource(uri: AnyUrl) -> str:
     table = parts[0]
     
     try:
-        # Validate table name to prevent SQL injection
-        safe_table = validate_table_name(table)
-        
-        conn = pyodbc.connect(config["conn_string"])
-        cursor = conn.cursor()
-        # Use TOP 100 for MSSQL (equivalent to LIMIT in MySQL)
-        cursor.execute(f"SELECT TOP 100 * FROM {safe_table}")
-        columns = [desc[0] for desc in cursor.description]
-        rows = cursor.fetchall()
-        result = [",".join(map(str, row)) for row in rows]
-        cursor.close()
-        conn.close()
-        return "\n".join([",".join(columns)] + result)
+        return await _read_table(config, table)
                 
     except Exception as e:
         logger.error(f"Database error reading resource {uri}: {str(e)}")
@@ -210,11 +396,10 @@ async def read_resource(uri: AnyUrl) -> str:
 @app.list_tools()
 async def list_tools() -> list[Tool]:
     """List available SQL Server tools."""
-    command = get_command()
     logger.info("Listing tools...")
     return [
         Tool(
-            name=command,
+            name=COMMAND,
             description="Execute an SQL query on the SQL Server",
             inputSchema={
                 "type": "object",
@@ -226,58 +411,88 @@ async def list_tools() -> list[Tool]:
                 },
                 "required": ["query"]
             }
+        ),
+        Tool(
+            name=READ_TABLES_COMMAND,
+            description="Read the first 100 rows of several tables at once",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "tables": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Table names, optionally schema-qualified (e.g. dbo.users)"
+                    }
+                },
+                "required": ["tables"]
+            }
         )
     ]
 
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Execute SQL commands."""
-    config = get_db_config()
-    command = get_command()
-    logger.info(f"Calling tool: {name} with arguments: {arguments}")
+    logger.info("Calling tool: %s with arguments: %s", name, arguments)
     
-    if name != command:
+    if name == READ_TABLES_COMMAND:
+        return await _call_read_tables(arguments)
+    
+    if name != COMMAND:
         raise ValueError(f"Unknown tool: {name}")
     
     query = arguments.get("query")
     if not query:
         raise ValueError("Query is required")
     
+    config = _load_config()
+    
     try:
-        conn = pyodbc.connect(config["conn_string"])
-        cursor = conn.cursor()
-        cursor.execute(query)
-        
-        # Special handling for table listing
-        if is_select_query(query) and "INFORMATION_SCHEMA.TABLES" in query.upper():
-            tables = cursor.fetchall()
-            result = ["Tables_in_" + config["database"]]  # Header
-            result.extend([table[0] for table in tables])
-            cursor.close()
-            conn.close()
-            return [TextContent(type="text", text="\n".join(result))]
-        
-        # Regular SELECT queries
-        elif is_select_query(query):
-            columns = [desc[0] for desc in cursor.description]
-            rows = cursor.fetchall()
-            result = [",".join(map(str, row)) for row in rows]
-            cursor.close()
-            conn.close()
-            return [TextContent(type="text", text="\n".join([",".join(columns)] + result))]
-        
-        # Non-SELECT queries
-        else:
-            conn.commit()
-            affected_rows = cursor.rowcount
-            cursor.close()
-            conn.close()
-            return [TextContent(type="text", text=f"Query executed successfully. Rows affected: {affected_rows}")]
+        is_select = is_select_query(query)
+        unquoted = strip_quoted(query)
+        pool = await get_pool(config)
+        # The pool resets the database and ROWCOUNT on every returned connection;
+        # only plain SELECTs are pooled, anything that may carry other session
+        # state is closed instead
+        text = await pool.run(
+            _do_call_tool, query, is_select, config["database"],
+            discard=changes_session(unquoted, is_select)
+        )
+        # DDL and SELECT ... INTO may have created or dropped tables
+        if not is_select or _INTO_RE.search(unquoted):
+            clear_resources_cache()
+        return [TextContent(type="text", text=text)]
                 
     except Exception as e:
         logger.error(f"Error executing SQL '{query}': {e}")
         return [TextContent(type="text", text=f"Error executing query: {str(e)}")]
 
+async def _call_read_tables(arguments: dict) -> list[TextContent]:
+    """Preview several tables, returning one text block per table."""
+    tables = arguments.get("tables")
+    if not tables or not isinstance(tables, list):
+        raise ValueError("Tables are required")
+    
+    config = _load_config()
+    results = await _read_many(config, tables)
+    
+    contents = []
+    for table, result in zip(tables, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error reading table {table}: {result}")
+            text = f"Error reading table {table}: {str(result)}"
+        else:
+            text = f"Table: {table}\n{result}"
+        contents.append(TextContent(type="text", text=text))
+    return contents
+
+async def _warm_up(pool: ConnectionPool) -> None:
+    """Open the pool's minimum number of connections."""
+    try:
+        await pool.fill()
+    except Exception as e:
+        # Connections are opened on demand; a failed warm-up is not fatal
+        logger.warning(f"Could not pre-open database connections: {str(e)}")
+
 async def main():
     """Main entry point to run the MCP server."""
     from mcp.server.stdio import stdio_server
@@ -289,9 +504,21 @@ async def main():
     if config.get('port') and config['port'] != "1433":
         server_info += f":{config['port']}"
     user_info = config.get('user', 'Windows Auth')
-    logger.info(f"Database config: {server_info}/{config['database']} as {user_info}")
+    logger.info("Database config: %s/%s as %s", server_info, config['database'], user_info)
+    
+    pool = await get_pool(config)
+    # asyncio.to_thread uses the default executor; size it to the pool so every
+    # worker thread can get a connection without queueing on the pool
+    asyncio.get_running_loop().set_default_executor(
+        concurrent.futures.ThreadPoolExecutor(
+            max_workers=pool.max_size, thread_name_prefix="mssql-io"
+        )
+    )
     
     async with stdio_server() as (read_stream, write_stream):
+        # Pre-open connections while the client initializes, so a slow database
+        # does not hold up the handshake
+        warm_up = asyncio.create_task(_warm_up(pool))
         try:
             await app.run(
                 read_stream,
@@ -301,6 +528,9 @@ async def main():
         except Exception as e:
             logger.error(f"Server error: {str(e)}", exc_info=True)
             raise
+        finally:
+            warm_up.cancel()
+            close_pool()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -2,6 +2,7 @@
 import pytest
 import os
 import pymssql
+from unittest.mock import Mock, patch
 
 @pytest.fixture(scope="session")
 def mssql_connection():
@@ -42,4 +43,56 @@ def mssql_cursor(mssql_connection):
     """Create a test cursor."""
     cursor = mssql_connection.cursor()
     yield cursor
-    cursor.close()
\ No newline at end of file
+    cursor.close()
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Drop cached configuration, listings and pooled connections between tests."""
+    from mssql_mcp_server.server import (
+        get_db_config, _sqlserver_driver, clear_resources_cache, close_pool
+    )
+    for cached in (get_db_config, _sqlserver_driver):
+        cached.cache_clear()
+    clear_resources_cache()
+    close_pool()
+    yield
+    for cached in (get_db_config, _sqlserver_driver):
+        cached.cache_clear()
+    clear_resources_cache()
+    close_pool()
+
+
+@pytest.fixture
+def mock_connect():
+    """Patch pyodbc with a SQL Server driver and test environment; yield the connect mock.
+
+    Tests configure the returned mock's ``return_value`` or ``side_effect``.
+    """
+    with patch('pyodbc.drivers', return_value=['ODBC Driver 18 for SQL Server']), \
+         patch('pyodbc.connect') as connect, \
+         patch.dict(os.environ, {
+             'MSSQL_USER': 'test',
+             'MSSQL_PASSWORD': 'test',
+             'MSSQL_DATABASE': 'test'
+         }):
+        yield connect
+
+@pytest.fixture
+def connections(mock_connect):
+    """Give every ``pyodbc.connect`` call a fresh connection; yield the list of them.
+
+    Each connection's cursor returns one ``id`` row from ``fetchmany`` and no
+    tables from ``fetchall``.
+    """
+    created = []
+    def make_conn(_):
+        conn = Mock()
+        cursor = conn.cursor.return_value
+        cursor.description = [('id',)]
+        cursor.fetchmany.side_effect = [[(1,)], []]
+        cursor.fetchall.return_value = []
+        created.append(conn)
+        return conn
+    
+    mock_connect.side_effect = make_conn
+    yield created
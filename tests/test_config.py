@@ -120,6 +120,23 @@ class TestDatabaseConfiguration:
             config = get_db_config()
             assert config['encrypt'] == False
 
+    def test_config_is_cached(self):
+        """Test that configuration is computed once and reused."""
+        with patch.dict(os.environ, {
+            'MSSQL_USER': 'testuser',
+            'MSSQL_PASSWORD': 'testpass',
+            'MSSQL_DATABASE': 'testdb'
+        }, clear=True):
+            with patch('pyodbc.drivers', return_value=['ODBC Driver 18 for SQL Server']) as mock_drivers:
+                first = get_db_config()
+                second = get_db_config()
+                assert first is second
+
+                # Rebuilding the config reuses the driver lookup
+                get_db_config.cache_clear()
+                assert get_db_config() is not first
+                assert mock_drivers.call_count == 1
+
 
 class TestTableNameValidation:
     """Test SQL table name validation and escaping."""
@@ -155,6 +172,7 @@ class TestTableNameValidation:
             '',                          # Empty
             '.',                         # Just dot
             '..',                        # Double dot
+            'users\n',                    # Trailing newline
         ]
         
         for name in invalid_names:
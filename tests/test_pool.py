@@ -0,0 +1,213 @@
+"""Test the pyodbc connection pool."""
+import asyncio
+import threading
+
+import pytest
+import pyodbc
+from unittest.mock import Mock, patch
+from mssql_mcp_server.pool import ConnectionPool, MAX_POOL_SIZE
+
+
+def _identity(conn):
+    return conn
+
+
+class TestConnectionPool:
+    """Test connection reuse, validation and error recovery."""
+
+    @pytest.mark.asyncio
+    async def test_connection_is_reused(self):
+        """Test that a released connection is handed out again."""
+        with patch('pyodbc.connect', side_effect=lambda _: Mock()) as mock_connect:
+            pool = ConnectionPool("DSN=test", min_size=0, max_size=2)
+            first = await pool.run(_identity)
+            second = await pool.run(_identity)
+            assert first is second
+            assert mock_connect.call_count == 1
+            first.rollback.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_connection_reused_after_query_error(self):
+        """Test that an error in the worker does not lose the connection."""
+        def failing(conn):
+            raise RuntimeError("Invalid column name")
+        
+        with patch('pyodbc.connect', side_effect=lambda _: Mock()) as mock_connect:
+            pool = ConnectionPool("DSN=test", min_size=0, max_size=1)
+            with pytest.raises(RuntimeError):
+                await pool.run(failing)
+            await pool.run(_identity)
+            assert mock_connect.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_broken_connection_is_replaced(self):
+        """Test that a connection whose rollback fails is discarded."""
+        broken = Mock()
+        broken.rollback.side_effect = pyodbc.Error("Communication link failure")
+        with patch('pyodbc.connect', side_effect=[broken, Mock()]) as mock_connect:
+            pool = ConnectionPool("DSN=test", min_size=0, max_size=1)
+            await pool.run(_identity)
+            assert await pool.run(_identity) is not broken
+            broken.close.assert_called_once()
+            assert mock_connect.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_connection_is_validated(self):
+        """Test that idle connections are checked before reuse."""
+        stale = Mock()
+        stale.cursor.return_value.execute.side_effect = pyodbc.Error("Connection reset")
+        with patch('pyodbc.connect', side_effect=[stale, Mock()]):
+            pool = ConnectionPool("DSN=test", min_size=0, max_size=1, validate_after=0)
+            await pool.run(_identity)
+            assert await pool.run(_identity) is not stale
+            stale.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_holds_slot_until_thread_finishes(self):
+        """Test that cancellation neither frees the slot early nor leaks the connection."""
+        started = threading.Event()
+        finish = threading.Event()
+        
+        def slow_query(conn):
+            started.set()
+            finish.wait(5)
+        
+        busy = Mock()
+        with patch('pyodbc.connect', side_effect=[busy, Mock()]):
+            pool = ConnectionPool("DSN=test", min_size=0, max_size=1)
+            task = asyncio.ensure_future(pool.run(slow_query))
+            await asyncio.to_thread(started.wait, 5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            
+            # The worker still owns the connection and its slot
+            assert pool._slots.locked()
+            busy.close.assert_not_called()
+            
+            finish.set()
+            conn = await asyncio.wait_for(pool.run(_identity), timeout=5)
+            assert conn is not busy
+            busy.close.assert_called_once()
+            assert not pool._closing
+
+    @pytest.mark.asyncio
+    async def test_cancelled_checkout_closes_connection(self):
+        """Test that a connection opened for a cancelled caller is closed and its slot freed."""
+        started = threading.Event()
+        finish = threading.Event()
+        opened = Mock()
+        
+        def connect(_):
+            if started.is_set():
+                return Mock()
+            started.set()
+            finish.wait(5)
+            return opened
+        
+        with patch('pyodbc.connect', side_effect=connect):
+            pool = ConnectionPool("DSN=test", min_size=0, max_size=1)
+            task = asyncio.ensure_future(pool.run(_identity))
+            await asyncio.to_thread(started.wait, 5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            
+            # The connect thread still holds the slot
+            assert pool._slots.locked()
+            
+            finish.set()
+            conn = await asyncio.wait_for(pool.run(_identity), timeout=5)
+            assert conn is not opened
+            opened.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fill_and_close(self):
+        """Test pre-opening and closing idle connections."""
+        connections = [Mock() for _ in range(3)]
+        with patch('pyodbc.connect', side_effect=connections) as mock_connect:
+            pool = ConnectionPool("DSN=test", min_size=3, max_size=5)
+            await pool.fill()
+            assert mock_connect.call_count == 3
+            pool.close()
+            for conn in connections:
+                conn.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fill_stops_when_closed(self):
+        """Test that a connection opened after the pool was closed is not kept."""
+        conn = Mock()
+        pool = ConnectionPool("DSN=test", min_size=2, max_size=2)
+        def connect(_):
+            pool.close()
+            return conn
+        
+        with patch('pyodbc.connect', side_effect=connect) as mock_connect:
+            await pool.fill()
+        assert mock_connect.call_count == 1
+        conn.close.assert_called_once()
+        assert not pool._idle
+
+    @pytest.mark.asyncio
+    async def test_aclose(self):
+        """Test closing idle connections without blocking the event loop."""
+        connections = [Mock() for _ in range(2)]
+        with patch('pyodbc.connect', side_effect=connections):
+            pool = ConnectionPool("DSN=test", min_size=2, max_size=2)
+            await pool.fill()
+            await pool.aclose()
+            assert pool.closed and not pool._idle
+            for conn in connections:
+                conn.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_checkin_after_close_discards(self):
+        """Test that connections returned to a closed pool are closed."""
+        conn = Mock()
+        with patch('pyodbc.connect', return_value=conn):
+            pool = ConnectionPool("DSN=test", min_size=0, max_size=1)
+            await pool.run(lambda _: pool.close())
+            conn.close.assert_called_once()
+            assert not pool._idle
+
+    @pytest.mark.asyncio
+    async def test_close_during_reset_discards(self):
+        """Test that a connection reset while the pool is closed is not kept."""
+        conn = Mock()
+        with patch('pyodbc.connect', return_value=conn):
+            pool = ConnectionPool("DSN=test", min_size=0, max_size=1, reset_sql="SET ROWCOUNT 0")
+            conn.rollback.side_effect = lambda: setattr(pool, 'closed', True)
+            await pool.run(_identity)
+            conn.close.assert_called_once()
+            assert not pool._idle
+
+    def test_turbodbc_prefers_unicode(self):
+        """Test that turbodbc connections use the options recommended for SQL Server."""
+        turbodbc = Mock()
+        with patch('mssql_mcp_server.pool._import_turbodbc', return_value=turbodbc):
+            pool = ConnectionPool("DSN=test", backend="turbodbc")
+        assert pool._connect() is turbodbc.connect.return_value
+        turbodbc.make_options.assert_called_once_with(prefer_unicode=True)
+        turbodbc.connect.assert_called_once_with(
+            connection_string="DSN=test", turbodbc_options=turbodbc.make_options.return_value
+        )
+
+    def test_unknown_backend(self):
+        """Test rejection of unsupported driver backends."""
+        with pytest.raises(ValueError, match="Unknown driver backend"):
+            ConnectionPool("DSN=test", backend="pymssql")
+
+    @pytest.mark.asyncio
+    async def test_pool_size_is_capped(self):
+        """Test that both bounds are limited to MAX_POOL_SIZE."""
+        with patch('pyodbc.connect', side_effect=lambda _: Mock()) as mock_connect:
+            pool = ConnectionPool("DSN=test", min_size=60, max_size=100)
+            assert pool.max_size == MAX_POOL_SIZE
+            assert pool.min_size == MAX_POOL_SIZE
+            await pool.fill()
+            assert mock_connect.call_count == MAX_POOL_SIZE
+
+    def test_invalid_pool_size(self):
+        """Test rejection of inconsistent pool sizes."""
+        with pytest.raises(ValueError, match="Invalid pool size"):
+            ConnectionPool("DSN=test", min_size=5, max_size=2)
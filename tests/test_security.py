@@ -1,7 +1,10 @@
 """Security tests for SQL injection prevention and safe query handling."""
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
-from mssql_mcp_server.server import validate_table_name, read_resource, call_tool
+from mssql_mcp_server.server import (
+    validate_table_name, read_resource, call_tool, is_select_query, changes_session,
+    strip_quoted
+)
 from pydantic import AnyUrl
 from mcp.types import TextContent
 
@@ -88,6 +91,82 @@ class TestSQLInjectionPrevention:
                 assert 'Error executing query' in result[0].text
 
 
+class TestSelectQueryDetection:
+    """Test detection of read-only SELECT queries."""
+    
+    def test_select_queries(self):
+        """Test that SELECT statements are recognised, including after comments."""
+        select_queries = [
+            "SELECT * FROM users",
+            "  select id from users",
+            "-- list users\nSELECT * FROM users",
+            "/* multi\nline */ SELECT * FROM users",
+            "SELECT*FROM users",
+            "SELECT/**/1",
+        ]
+        for query in select_queries:
+            assert is_select_query(query), query
+    
+    def test_non_select_queries(self):
+        """Test that other statements are not treated as SELECT."""
+        other_queries = [
+            "DELETE FROM users",
+            "-- SELECT\nDROP TABLE users",
+            "/* SELECT */ UPDATE users SET name = 'x'",
+            "SELECTED_ROWS",
+            "",
+            "-- only a comment",
+        ]
+        for query in other_queries:
+            assert not is_select_query(query), query
+
+
+def _changes_session(query):
+    return changes_session(strip_quoted(query), is_select_query(query))
+
+
+class TestSessionStatementDetection:
+    """Test detection of queries whose connections must not be pooled."""
+    
+    def test_session_statements(self):
+        """Test that SET options, procedure calls, keys, cursors and temp tables are recognised."""
+        session_queries = [
+            "SET NOCOUNT ON; SELECT * FROM users",
+            "SELECT 1; set transaction isolation level serializable",
+            "SELECT 1\nSET ANSI_NULLS OFF",
+            "SELECT 1 SET LANGUAGE French",
+            "IF @@TRANCOUNT = 0 SET XACT_ABORT ON",
+            "BEGIN SET DATEFORMAT dmy END",
+            "EXEC sp_set_session_context 'user', 'x'",
+            "sp_set_session_context 'k','v'",
+            "-- setup\nEXECUTE dbo.prepare",
+            "BEGIN EXECUTE AS USER = 'reporting' END",
+            "OPEN SYMMETRIC KEY k DECRYPTION BY CERTIFICATE c",
+            "DECLARE c CURSOR GLOBAL FOR SELECT 1 OPEN c",
+            "SELECT * INTO #recent FROM users",
+            "CREATE TABLE ##shared (id INT)",
+        ]
+        for query in session_queries:
+            assert _changes_session(query), query
+    
+    def test_other_statements_are_not_pooled(self):
+        """Test that anything but a plain SELECT is treated as changing the session."""
+        for query in ["USE master", "UPDATE users SET name = 'x'", "INSERT INTO users (name) VALUES ('#1')"]:
+            assert _changes_session(query), query
+    
+    def test_plain_selects(self):
+        """Test that keywords in literals, identifiers and comments are ignored."""
+        plain_queries = [
+            "SELECT * FROM users WHERE note LIKE '%use%; set x'",
+            "SELECT [Set], \"exec\", '#1' FROM users",
+            "/* SET NOCOUNT ON; */ SELECT 1",
+            "SELECT id FROM users -- OPEN c",
+            "SELECT offset, opened FROM settings",
+        ]
+        for query in plain_queries:
+            assert not _changes_session(query), query
+
+
 class TestInputValidation:
     """Test input validation for all user inputs."""
     
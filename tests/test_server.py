@@ -1,4 +1,10 @@
+import asyncio
+import collections
+import contextlib
 import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from mssql_mcp_server import server
+from mssql_mcp_server.pool import ConnectionPool
 from mssql_mcp_server.server import app, list_tools, list_resources, read_resource, call_tool
 from pydantic import AnyUrl
 
@@ -10,9 +16,11 @@ def test_server_initialization():
 async def test_list_tools():
     """Test that list_tools returns expected tools."""
     tools = await list_tools()
-    assert len(tools) == 1
+    assert len(tools) == 2
     assert tools[0].name == "execute_sql"
     assert "query" in tools[0].inputSchema["properties"]
+    assert tools[1].name == "read_tables"
+    assert "tables" in tools[1].inputSchema["properties"]
 
 @pytest.mark.asyncio
 async def test_call_tool_invalid_name():
@@ -26,6 +34,190 @@ async def test_call_tool_missing_query():
     with pytest.raises(ValueError, match="Query is required"):
         await call_tool("execute_sql", {})
 
+@pytest.mark.asyncio
+async def test_list_resources_is_cached(mock_connect):
+    """Test that repeated listings within the TTL reuse the first result."""
+    mock_conn = mock_connect.return_value
+    mock_conn.cursor.return_value.fetchall.return_value = [('dbo.users',)]
+    first = await list_resources()
+    second = await list_resources()
+    assert [r.name for r in second] == [r.name for r in first] == ["Table: dbo.users"]
+    executed = [c.args[0] for c in mock_conn.cursor.return_value.execute.call_args_list]
+    assert sum('INFORMATION_SCHEMA.TABLES' in sql for sql in executed) == 1
+
+@pytest.mark.asyncio
+async def test_list_resources_cache_invalidation(mock_connect):
+    """Test that SELECT ... INTO invalidates the listing and stale listings are not cached."""
+    mock_cursor = mock_connect.return_value.cursor.return_value
+    mock_cursor.fetchall.return_value = [('dbo.users',)]
+    # SELECT ... INTO returns no result set
+    mock_cursor.description = None
+    mock_cursor.rowcount = 2
+    
+    await list_resources()
+    result = await call_tool("execute_sql", {"query": "SELECT * INTO archive FROM users"})
+    assert result[0].text == "Query executed successfully. Rows affected: 2"
+    mock_connect.return_value.commit.assert_called_once()
+    await list_resources()
+    executed = [c.args[0] for c in mock_cursor.execute.call_args_list]
+    assert sum('INFORMATION_SCHEMA.TABLES' in sql for sql in executed) == 2
+    
+    # A DDL statement finishing while a listing runs leaves it uncached
+    listing = server._do_list_resources
+    def listing_during_ddl(conn):
+        server.clear_resources_cache()
+        return listing(conn)
+    server.clear_resources_cache()
+    with patch.object(server, '_do_list_resources', listing_during_ddl):
+        await list_resources()
+    assert server._resources_cache is None
+
+@pytest.mark.asyncio
+async def test_changed_config_retires_pool(connections):
+    """Test that a new connection string replaces the pool and closes its idle connections."""
+    with patch.object(server, 'CONFIG_RELOAD', True):
+        await list_resources()
+        with patch.dict('os.environ', {'MSSQL_DATABASE': 'other'}):
+            await list_resources()
+    
+    old_conn, new_conn = connections
+    old_conn.close.assert_called_once()
+    new_conn.close.assert_not_called()
+    assert server._pool.conn_string.endswith("DATABASE=other;UID=test;PWD=test")
+
+@pytest.mark.asyncio
+async def test_select_results_csv_formatting(mock_connect):
+    """Test that SELECT results are streamed as CSV with quoting and empty NULLs."""
+    rows = [[(1, 'Doe, John', None)], [(2, 'Jane', 'line\nbreak')], []]
+    expected = 'id,name,note\n1,"Doe, John",\n2,Jane,"line\nbreak"'
+    mock_cursor = mock_connect.return_value.cursor.return_value
+    mock_cursor.description = [('id',), ('name',), ('note',)]
+    
+    mock_cursor.fetchmany.side_effect = list(rows)
+    assert await read_resource(AnyUrl("mssql://dbo.users/data")) == expected
+    
+    mock_cursor.fetchmany.side_effect = list(rows)
+    result = await call_tool("execute_sql", {"query": "SELECT id, name, note FROM users"})
+    assert result[0].text == expected
+
+@pytest.mark.asyncio
+async def test_call_tool_table_listing(mock_connect):
+    """Test that INFORMATION_SCHEMA.TABLES queries list only the first column."""
+    mock_cursor = mock_connect.return_value.cursor.return_value
+    mock_cursor.description = [('TABLE_NAME',), ('TABLE_SCHEMA',), ('TABLE_TYPE',)]
+    mock_cursor.fetchmany.side_effect = [
+        [('users', 'dbo', 'BASE TABLE'), ('order,items', 'dbo', 'BASE TABLE')],
+        [],
+    ]
+    query = "SELECT TABLE_NAME, TABLE_SCHEMA, TABLE_TYPE FROM information_schema.tables"
+    result = await call_tool("execute_sql", {"query": query})
+    assert result[0].text == 'Tables_in_test\nusers\n"order,items"'
+
+@pytest.mark.asyncio
+async def test_read_tables(connections):
+    """Test previewing several tables, with invalid names reported per table."""
+    result = await call_tool("read_tables", {"tables": ["dbo.users", "dbo.orders", "bad;name"]})
+    assert [r.text for r in result] == [
+        "Table: dbo.users\nid\n1",
+        "Table: dbo.orders\nid\n1",
+        "Error reading table bad;name: Invalid table name: bad;name",
+    ]
+
+@pytest.mark.asyncio
+async def test_execute_sql_session_state_is_not_reused(connections):
+    """Test that only connections that ran a plain SELECT are pooled."""
+    await call_tool("execute_sql", {"query": "SET NOCOUNT ON; SELECT id FROM users"})
+    await call_tool("execute_sql", {"query": "SELECT * INTO #tmp FROM users"})
+    await call_tool("execute_sql", {"query": "UPDATE users SET note = 'use'"})
+    await call_tool("execute_sql", {"query": "SELECT id FROM users WHERE note = 'set'"})
+    
+    assert len(connections) == 4
+    for conn in connections[:3]:
+        conn.close.assert_called_once()
+    connections[3].close.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_execute_sql_select_resets_session(mock_connect):
+    """Test that a pooled connection is reset after running a SELECT."""
+    mock_cursor = mock_connect.return_value.cursor.return_value
+    mock_cursor.description = [('id',)]
+    mock_cursor.fetchmany.side_effect = [[(1,)], []]
+    await call_tool("execute_sql", {"query": "SELECT id FROM users"})
+    
+    executed = [c.args[0] for c in mock_cursor.execute.call_args_list]
+    assert executed == ["SELECT id FROM users", "USE [test]; SET ROWCOUNT 0"]
+    mock_connect.return_value.close.assert_not_called()
+
+class _MaskedColumn:
+    """Stand-in for a NumPy masked array: masked entries come back as None."""
+    
+    def __init__(self, values):
+        self.values = values
+    
+    def tolist(self):
+        return list(self.values)
+
+def test_turbodbc_select_formatting():
+    """Test the columnar turbodbc SELECT path: header, NULLs and quoting."""
+    conn = Mock()
+    cursor = conn.cursor.return_value
+    cursor.description = [('id',), ('name',)]
+    cursor.fetchnumpybatches.return_value = iter([
+        {'id': _MaskedColumn([1, None]), 'name': _MaskedColumn(['Doe, John', 'Jane'])},
+    ])
+    with patch.object(server, 'DRIVER_BACKEND', 'turbodbc'):
+        result = server._do_call_tool(conn, "SELECT id, name FROM users", True, "test")
+    assert result == 'id,name\n1,"Doe, John"\n,Jane'
+    cursor.fetchmany.assert_not_called()
+
+def test_turbodbc_results_are_read_in_batches():
+    """Test that every batch from fetchnumpybatches() is written in order."""
+    cursor = Mock()
+    cursor.description = [('id',), ('note',)]
+    cursor.fetchnumpybatches.return_value = iter([
+        {'id': _MaskedColumn([1, 2]), 'note': _MaskedColumn(['a', None])},
+        {'id': _MaskedColumn([3]), 'note': _MaskedColumn(['line\nbreak'])},
+        {'id': _MaskedColumn([]), 'note': _MaskedColumn([])},
+    ])
+    result = server._format_columns(cursor)
+    assert result == 'id,note\n1,a\n2,\n3,"line\nbreak"'
+    cursor.fetchallnumpy.assert_not_called()
+
+def test_turbodbc_duplicate_column_names():
+    """Test that columns sharing a name fall back to row fetches instead of collapsing."""
+    cursor = Mock()
+    cursor.description = [('',), ('',)]
+    # fetchnumpybatches() keys columns by name, so this batch holds one column
+    batch = collections.OrderedDict(zip(['', ''], [_MaskedColumn([3]), _MaskedColumn([7])]))
+    assert len(batch) == 1
+    cursor.fetchnumpybatches.return_value = iter([batch])
+    cursor.fetchmany.side_effect = [[(3, 7)], []]
+    assert server._format_columns(cursor) == ',\n3,7'
+    cursor.fetchnumpybatches.assert_not_called()
+    
+    cursor = Mock()
+    cursor.description = [('id',), ('id',)]
+    cursor.fetchmany.side_effect = [[(1, 2)], []]
+    assert server._format_columns(cursor) == 'id,id\n1,2'
+    cursor.fetchnumpybatches.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_main_serves_before_warm_up(mock_connect):
+    """Test that a slow connection warm-up does not hold up the MCP server."""
+    never = asyncio.Event()
+    async def slow_fill(self):
+        await never.wait()
+    
+    @contextlib.asynccontextmanager
+    async def stdio_server():
+        yield (None, None)
+    
+    with patch.object(ConnectionPool, 'fill', slow_fill), \
+         patch('mcp.server.stdio.stdio_server', stdio_server), \
+         patch.object(server.app, 'run', AsyncMock()) as run:
+        await asyncio.wait_for(server.main(), timeout=5)
+    run.assert_awaited_once()
+
 # Skip database-dependent tests if no database connection
 @pytest.mark.asyncio
 @pytest.mark.skipif(